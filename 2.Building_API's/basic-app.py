@@ -4,6 +4,6 @@ app = FastAPI()
 
 # Decorator @app
 @app.get('/') # / forward slash = HomePage {route/Endpoint} GET=retrieve : user is going to see the data
-def home(): # root URL Function
+def home() -> dict[str, str]: # root URL Function # return type declared -> serialized straight to JSON bytes by Pydantic
     return {'message':'Hello FastAPI!'} # HomePage Message # Python Dict sent as json Object
 
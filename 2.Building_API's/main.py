@@ -1,51 +1,86 @@
 # Contains only API endpoints
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Depends, Request, Response
 # from BuildingAPIs.models import Employee
 from BuildingAPIs.models_val import Employee
-from typing import List
+from typing import Dict
+import msgspec
 
 # variableName # VariableType # VariableValue
-employees_db: List[Employee] = []
+# Keyed on employee id -> every lookup is one hash lookup instead of a scan of a list
+employees_db: Dict[int, Employee] = {}
+# Encoded JSON of single employees, filled on read and dropped on every write,
+# so a repeated GET /employees/{emp_id} skips serialization entirely
+employee_json_cache: Dict[int, bytes] = {}
 
 app = FastAPI()
 
+# Employee is a msgspec Struct, so FastAPI can't parse/serialize it itself:
+# request bodies are decoded (and validated) straight from the raw bytes,
+# and responses are encoded with msgspec.
+employee_decoder = msgspec.json.Decoder(Employee)
+
+async def employee_body(request: Request) -> Employee:
+    try:
+        return employee_decoder.decode(await request.body())
+    except msgspec.DecodeError as exc: # also covers msgspec.ValidationError
+        raise HTTPException(status_code=422, detail=str(exc))
+
+def json_response(content) -> Response:
+    return Response(content=msgspec.json.encode(content), media_type='application/json')
+
+# OpenAPI docs: schemas generated by msgspec instead of pydantic
+employee_schema = msgspec.json.schema_components([Employee])[1]['Employee']
+employee_docs = {200: {'content': {'application/json': {'schema': employee_schema}}}}
+employees_docs = {200: {'content': {'application/json': {'schema': {'type': 'array', 'items': employee_schema}}}}}
+employee_body_docs = {'requestBody': {'required': True, 'content': {'application/json': {'schema': employee_schema}}}}
+
+# Endpoints are `async def`: they only touch the in-memory dict, so they run
+# directly on the event loop (plain `def` endpoints are sent to a threadpool)
+
 # 1. Endpoint Read All the employees
-@app.get('/employees',response_model=List[Employee])
-def get_employees():
-    return employees_db
+@app.get('/employees',responses=employees_docs)
+async def get_employees():
+    return json_response(list(employees_db.values()))
 
 # 2. Read Specific Employees
-@app.get('/employees/{emp_id}',response_model=Employee)
-def get_employee(emp_id: int):
-    for index, employee in enumerate(employees_db):
-        if employee.id == emp_id:
-            return employee
-    raise HTTPException(status_code=404,detail='Employee Not Found')
+@app.get('/employees/{emp_id}',responses=employee_docs)
+async def get_employee(emp_id: int):
+    cached = employee_json_cache.get(emp_id)
+    if cached is None:
+        employee = employees_db.get(emp_id)
+        if employee is None:
+            raise HTTPException(status_code=404,detail='Employee Not Found')
+        cached = employee_json_cache[emp_id] = msgspec.json.encode(employee)
+    return Response(content=cached, media_type='application/json')
 
 # 3. Add an employee
-@app.post('/add_employee',response_model=Employee)
-def add_employee(new_emp: Employee):
-    for employee in employees_db:
-        if employee.id == new_emp.id:
-            raise HTTPException(status_code=400, detail='Employee already exist')
-    employees_db.append(new_emp)
-    return new_emp
+@app.post('/add_employee',responses=employee_docs,openapi_extra=employee_body_docs)
+async def add_employee(new_emp: Employee = Depends(employee_body)):
+    if new_emp.id in employees_db:
+        raise HTTPException(status_code=400, detail='Employee already exist')
+    employees_db[new_emp.id] = new_emp
+    employee_json_cache.pop(new_emp.id, None)
+    return json_response(new_emp)
 
 # 4. update an employee
-@app.put('/update_employee/{emp_id}',response_model=Employee)
-def update_employee(emp_id:int, updated_employee:Employee):
-    for index, employee in enumerate(employees_db):
-        if employee.id == emp_id:
-            employees_db[index] = updated_employee
-            return updated_employee
-    raise HTTPException(status_code=404, detail='Employee not Found')
+@app.put('/update_employee/{emp_id}',responses=employee_docs,openapi_extra=employee_body_docs)
+async def update_employee(emp_id:int, updated_employee: Employee = Depends(employee_body)):
+    if emp_id not in employees_db:
+        raise HTTPException(status_code=404, detail='Employee not Found')
+    # the new id must not belong to another employee, or re-keying would overwrite it
+    if updated_employee.id != emp_id and updated_employee.id in employees_db:
+        raise HTTPException(status_code=400, detail='Employee already exist')
+    # re-key in case the update changes the id
+    del employees_db[emp_id]
+    employees_db[updated_employee.id] = updated_employee
+    employee_json_cache.pop(emp_id, None)
+    employee_json_cache.pop(updated_employee.id, None)
+    return json_response(updated_employee)
 
 # 5. Delete an Employee
 @app.delete('/delete_employee/{emp_id}')
-def delete_employee(emp_id:int):
-    for index, employee in enumerate(employees_db):
-        if employee.id == emp_id:
-            del employees_db[index]
-            return{'message':'Employee Deleted Successfully'}
-        
-    raise HTTPException(status_code=404,detail='Employee Not Found')
+async def delete_employee(emp_id:int) -> Dict[str, str]:
+    if employees_db.pop(emp_id, None) is None:
+        raise HTTPException(status_code=404,detail='Employee Not Found')
+    employee_json_cache.pop(emp_id, None)
+    return{'message':'Employee Deleted Successfully'}
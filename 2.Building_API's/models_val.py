@@ -1,11 +1,12 @@
-from pydantic import BaseModel, Field, StrictInt
-from typing import Optional
+import msgspec
+from typing import Annotated, Optional
 
-class Employee(BaseModel):
-    id: int = Field(...,gt=0) ## required Field (...) for greater than gt=0
-    name: str = Field(..., min_length=3,max_length=30)
-    department: str = Field(..., min_length=3,max_length=30)
-    age: int = Field(..., gt=18, description='Age must be greater than 18')
-    # age: Optional[int] = Field(default=None) Optional Field can be included like this
-    # age: Optional[StrictInt] = Field(default=None) # -> Strictly checks the value is entered is integer or not
-    # like wise we have -> , StrictBool, StrictBytes, StrictFloat, SecretStr
+# msgspec Struct instead of a pydantic BaseModel: the constraints below are
+# checked by msgspec's C decoder in the same pass that parses the JSON body
+class Employee(msgspec.Struct):
+    id: Annotated[int, msgspec.Meta(gt=0)] ## required field, greater than gt=0
+    name: Annotated[str, msgspec.Meta(min_length=3, max_length=30)]
+    department: Annotated[str, msgspec.Meta(min_length=3, max_length=30)]
+    age: Annotated[int, msgspec.Meta(gt=18, description='Age must be greater than 18')]
+    # age: Optional[int] = None  Optional Field can be included like this
+    # msgspec is strict by default -> an int field rejects "25" or 25.0, like pydantic's StrictInt
@@ -1,4 +1,4 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from pydantic import BaseModel
 
 
@@ -11,7 +11,12 @@ class User(BaseModel):
 # Assign Object to Class FastAPI
 app = FastAPI()
 
+# The user never changes: validate and serialize it once at import time
+_USER_BYTES = User(id=1,name='Bruce').model_dump_json().encode()
+
 # Endpoint 
-@app.get('/user', response_model=User)
+# No response_model (the schema is still documented through `responses`), so
+# FastAPI doesn't re-validate or re-encode anything: each request only sends the bytes
+@app.get('/user', responses={200: {'model': User}})
 def get_user():
-    return User(id=1,name='Bruce')
\ No newline at end of file
+    return Response(content=_USER_BYTES, media_type='application/json')
\ No newline at end of file
@@ -11,11 +11,12 @@ async def run_task(name, seconds):
 
 async def main():
     start = timer()
-    await asyncio.gather(
-    run_task('Task_1', 2),
-    run_task('Task_2', 1),
-    run_task('Task_3', 3)
-    )
+    # TaskGroup (Python 3.11+): all tasks run concurrently, and the block only
+    # exits once every task is done; unlike gather() there is no extra
+    # aggregating future, and a failing task cancels the others
+    async with asyncio.TaskGroup() as tg:
+        for name, seconds in (('Task_1', 2), ('Task_2', 1), ('Task_3', 3)):
+            tg.create_task(run_task(name, seconds))
     print(f'\n Total time taken: {timer() - start:.2f} sec.')
 
 asyncio.run(main())
\ No newline at end of file
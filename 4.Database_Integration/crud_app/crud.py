@@ -8,9 +8,49 @@ Purpose:
     - Keeps CRUD operations modular, reusable, and easy to maintain.
 """
 
+from sqlalchemy import delete, insert, select, update
 from sqlalchemy.orm import Session
 from crud_app import models, schemas
 
+# Columns needed to build an EmployeeOut (selected / returned by the statements below)
+EMPLOYEE_COLUMNS = (models.Employee.id, models.Employee.name, models.Employee.email)
+
+
+def to_employee_out(db_employee: models.Employee) -> schemas.EmployeeOut:
+    """
+    Build an EmployeeOut from an ORM row without re-validating it.
+
+    Rows read back from the database are already trusted, so
+    `model_construct` skips the per-field type and email checks.
+
+    Args:
+        db_employee (Employee): ORM object (or column row) loaded from the database.
+
+    Returns:
+        EmployeeOut: Response schema populated from the row.
+    """
+    return schemas.EmployeeOut.model_construct(
+        id=db_employee.id,
+        name=db_employee.name,
+        email=db_employee.email
+    )
+
+
+def to_employee_dict(db_employee: models.Employee) -> dict:
+    """
+    Build the JSON-ready dict of an employee (same fields as EmployeeOut).
+
+    Read endpoints hand this straight to the response serializer, so no
+    schema object is built and dumped back into a dict per row.
+
+    Args:
+        db_employee (Employee): ORM object (or column row) loaded from the database.
+
+    Returns:
+        dict: `name`, `email` and `id` of the employee.
+    """
+    return {"name": db_employee.name, "email": db_employee.email, "id": db_employee.id}
+
 
 def get_employees(db: Session):
     """
@@ -20,9 +60,12 @@ def get_employees(db: Session):
         db (Session): SQLAlchemy session object.
 
     Returns:
-        List[Employee]: List of all Employee objects.
+        List[dict]: All employees, as JSON-ready dicts (EmployeeOut fields).
     """
-    return db.query(models.Employee).all()
+    # 2.0-style select of only the columns the response needs: plain rows, no legacy
+    # Query wrapper, ORM object construction or identity-map bookkeeping per employee.
+    rows = db.execute(select(*EMPLOYEE_COLUMNS)).all()
+    return [{"name": name, "email": email, "id": id_} for id_, name, email in rows]
 
 
 def get_employee(db: Session, emp_id: int):
@@ -34,70 +77,84 @@ def get_employee(db: Session, emp_id: int):
         emp_id (int): ID of the employee to fetch.
 
     Returns:
-        Employee | None: The employee object if found, else None.
+        dict | None: The employee as a JSON-ready dict (EmployeeOut fields) if found, else None.
     """
-    return db.query(models.Employee).filter(models.Employee.id == emp_id).first()
+    # Primary-key lookup: checks the session's identity map before querying
+    db_employee = db.get(models.Employee, emp_id)
+    return to_employee_dict(db_employee) if db_employee else None
 
 
 def create_employee(db: Session, employee: schemas.EmployeeCreate):
     """
     Create a new employee record.
 
+    Uses `INSERT ... RETURNING`, so the generated ID comes back with the
+    insert itself instead of a follow-up `SELECT` (refresh).
+
     Args:
         db (Session): SQLAlchemy session object.
         employee (EmployeeCreate): Pydantic schema with employee details.
 
     Returns:
-        Employee: The newly created employee object.
+        EmployeeOut: The newly created employee.
     """
-    db_employee = models.Employee(
-        name=employee.name,
-        email=employee.email
+    stmt = (
+        insert(models.Employee)
+        .values(name=employee.name, email=employee.email)
+        .returning(*EMPLOYEE_COLUMNS)
     )
-    db.add(db_employee)
+    row = db.execute(stmt).one()
     db.commit()
-    db.refresh(db_employee)
-    return db_employee
+    return to_employee_out(row)
 
 
 def update_employee(db: Session, emp_id: int, employee: schemas.EmployeeUpdate):
     """
     Update an existing employee record.
 
+    Uses a single `UPDATE ... WHERE id = :id RETURNING ...` statement instead
+    of selecting the row, mutating it and refreshing it.
+
     Args:
         db (Session): SQLAlchemy session object.
         emp_id (int): ID of the employee to update.
         employee (EmployeeUpdate): Pydantic schema with updated details.
 
     Returns:
-        Employee | None: The updated employee object if found, else None.
+        EmployeeOut | None: The updated employee if found, else None.
     """
-    db_employee = db.query(models.Employee).filter(models.Employee.id == emp_id).first()
-
-    if db_employee:
-        db_employee.name = employee.name
-        db_employee.email = employee.email
-        db.commit()
-        db.refresh(db_employee)
-
-    return db_employee
+    stmt = (
+        update(models.Employee)
+        .where(models.Employee.id == emp_id)
+        .values(name=employee.name, email=employee.email)
+        .returning(*EMPLOYEE_COLUMNS)
+        .execution_options(synchronize_session=False)
+    )
+    row = db.execute(stmt).one_or_none()
+    db.commit()
+    return to_employee_out(row) if row else None
 
 
 def delete_employee(db: Session, emp_id: int):
     """
     Delete an employee record by ID.
 
+    Uses a single `DELETE ... WHERE id = :id RETURNING id` statement instead
+    of selecting the row first.
+
     Args:
         db (Session): SQLAlchemy session object.
         emp_id (int): ID of the employee to delete.
 
     Returns:
-        Employee | None: The deleted employee object if found, else None.
+        int | None: The ID of the deleted employee if found, else None.
     """
-    db_employee = db.query(models.Employee).filter(models.Employee.id == emp_id).first()
-
-    if db_employee:
-        db.delete(db_employee)
-        db.commit()
-
-    return db_employee
+    stmt = (
+        delete(models.Employee)
+        .where(models.Employee.id == emp_id)
+        .returning(models.Employee.id)
+        .execution_options(synchronize_session=False)
+    )
+    deleted_id = db.execute(stmt).scalar_one_or_none()
+    db.commit()
+    return deleted_id
@@ -4,30 +4,96 @@ database.py
 This module handles the database configuration and setup for the CRUD application.
 
 Components:
-    - SQLALCHEMY_DATABASE_URL: The connection string for the database (SQLite in this case).
-    - engine: Creates a connection to the database using SQLAlchemy.
+    - SQLALCHEMY_DATABASE_URL: The connection string for the database (SQLite by default).
+    - engine: Creates a connection to the database using SQLAlchemy, with a sized connection pool.
+              File-based SQLite connections are switched to WAL journaling on connect.
     - SessionLocal: A session factory for creating individual database sessions.
+    - ScopedSession: A registry handing out one `SessionLocal` session per request.
     - Base: A declarative base class used to define ORM models.
 
 Usage:
     Import `SessionLocal` to create database sessions inside your routes or services.
+    Import `ScopedSession` to share one session per request (set `request_scope` per request
+    and call `ScopedSession.remove()` once it is finished).
     Import `Base` in your models module and extend it when defining ORM classes.
+
+Environment Variables:
+    - DATABASE_URL     Overrides the SQLite default (e.g. a Postgres/MySQL URL).
+    - DB_POOL_SIZE     Connections kept open in the pool (default: 25).
+    - DB_MAX_OVERFLOW  Extra connections allowed under burst load (default: 25).
 """
 
-from sqlalchemy import create_engine
+import os
+from contextvars import ContextVar
+
+from sqlalchemy import create_engine, event, make_url
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import scoped_session, sessionmaker
+from sqlalchemy.pool import StaticPool
 
-# Database URL (using SQLite here, file stored as test.db in current directory)
-SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
+# Database URL (using SQLite by default, file stored as test.db in current directory)
+SQLALCHEMY_DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./test.db")
+
+# Pool sizing: the default (5 + 10 overflow) throttles requests under concurrency
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "25"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "25"))
 
 # Engine: Core interface to the database
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
-)
+database_url = make_url(SQLALCHEMY_DATABASE_URL)
+is_sqlite = database_url.get_backend_name() == "sqlite"
+
+if is_sqlite and database_url.database in (None, "", ":memory:"):
+    # In-memory SQLite lives inside a single connection, so share that one connection
+    engine = create_engine(
+        SQLALCHEMY_DATABASE_URL,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+elif is_sqlite:
+    # File-based SQLite: pooled connections, no network to pre-ping or recycle
+    engine = create_engine(
+        SQLALCHEMY_DATABASE_URL,
+        connect_args={"check_same_thread": False},
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+    )
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, _connection_record):
+        """
+        Tune every new SQLite connection:
+            - journal_mode=WAL     readers keep reading while a write is in progress
+                                   (the default rollback journal blocks them)
+            - synchronous=NORMAL   fsync at checkpoints only; safe with WAL
+            - temp_store=MEMORY    temporary tables/indices stay in RAM
+            - mmap_size=256 MB     read pages through a memory map instead of read() calls
+        """
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")
+        cursor.close()
+else:
+    engine = create_engine(
+        SQLALCHEMY_DATABASE_URL,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_pre_ping=True,   # Drop dead connections before handing them out
+        pool_recycle=1800,    # Reopen connections older than 30 minutes
+    )
 
 # SessionLocal: Factory for creating new session objects (transactions)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# expire_on_commit=False: objects loaded in the request stay usable after commit,
+# instead of being expired and silently re-SELECTed on the next attribute access
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
+
+# request_scope: Identifies the current request. It is a context variable (not a thread-local),
+# so the value follows the request into the threadpool running sync routes and dependencies.
+request_scope: ContextVar = ContextVar("request_scope", default=None)
+
+# ScopedSession: Returns the same session for every call made within one request
+ScopedSession = scoped_session(SessionLocal, scopefunc=request_scope.get)
 
 # Base: Used as a base class for ORM models (tables are created from these classes)
 Base = declarative_base()
@@ -12,9 +12,13 @@ Endpoints:
     - DELETE /employees/{id}   → Delete an employee
 """
 
-from fastapi import FastAPI, HTTPException, Depends
+import hashlib
+
+from fastapi import FastAPI, HTTPException, Depends, Request, Response
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
-from crud_app.database import engine, SessionLocal, Base
+from crud_app.database import engine, ScopedSession, Base, request_scope
 from typing import List
 from crud_app import models, schemas, crud
 
@@ -23,22 +27,61 @@ Base.metadata.create_all(bind=engine)
 
 app = FastAPI(title="Employee CRUD API", version="1.0")
 
+# Compress large responses (e.g. the GET /employees list) on the way out: orjson → gzip.
+# Bodies under 1 KB are sent as-is; level 5 trades a little ratio for much less CPU than 9.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+
+class DBSessionMiddleware:
+    """
+    Pure ASGI middleware that scopes one database session to each request.
+
+    Marks the request in `request_scope` before calling the app and closes the
+    request's `ScopedSession` once the response has been sent, so session
+    cleanup happens in one place instead of in every `get_db` call.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        token = request_scope.set(object())
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            ScopedSession.remove()  # close the session and return its connection to the pool
+            request_scope.reset(token)
+
+
+app.add_middleware(DBSessionMiddleware)
+
 
 # Dependency to get DB session
-def get_db():
+def get_db() -> Session:
     """
-    Dependency that provides a database session.
-    Ensures session is closed after the request lifecycle.
+    Dependency that provides the database session of the current request.
+    A plain function (no generator), so FastAPI has no per-request cleanup
+    to run; DBSessionMiddleware closes the session after the response.
     """
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+    return ScopedSession()
+
+
+def employee_etag(employee: dict) -> str:
+    """
+    Strong ETag for an employee, derived from the fields it is served with.
+    BLAKE2b is fast and only needs to detect changes, not resist attackers.
+    """
+    digest = hashlib.blake2b(
+        f"{employee['id']}:{employee['name']}:{employee['email']}".encode(), digest_size=8
+    ).hexdigest()
+    return f'"{digest}"'
 
 
 # 1. Create an Employee
-@app.post('/employees', response_model=schemas.EmployeeOut)
+@app.post('/employees', responses={200: {"model": schemas.EmployeeOut}})
 def create_employee(employee: schemas.EmployeeCreate, db: Session = Depends(get_db)):
     """
     Create a new employee record.
@@ -50,24 +93,31 @@ def create_employee(employee: schemas.EmployeeCreate, db: Session = Depends(get_
     Returns:
         EmployeeOut: The newly created employee.
     """
-    return crud.create_employee(db, employee)
+    return ORJSONResponse(crud.create_employee(db, employee).model_dump())
 
 
 # 2. Get all Employees
-@app.get('/employees', response_model=List[schemas.EmployeeOut])
+@app.get('/employees', responses={200: {"model": List[schemas.EmployeeOut]}})
 def get_employees(db: Session = Depends(get_db)):
     """
     Retrieve all employees from the database.
     """
-    return crud.get_employees(db)
+    return ORJSONResponse(crud.get_employees(db))
 
 
 # 3. Get specific Employee
-@app.get('/employees/{emp_id}', response_model=schemas.EmployeeOut)
-def get_employee(emp_id: int, db: Session = Depends(get_db)):
+@app.get(
+    '/employees/{emp_id}',
+    responses={200: {"model": schemas.EmployeeOut}, 304: {"description": "Not Modified"}}
+)
+def get_employee(emp_id: int, request: Request, db: Session = Depends(get_db)):
     """
     Retrieve an employee by ID.
 
+    The response carries an `ETag` header. When the client sends it back in
+    `If-None-Match` and the employee is unchanged, an empty `304 Not Modified`
+    is returned instead of serializing the employee again.
+
     Args:
         emp_id (int): Employee ID.
 
@@ -75,16 +125,21 @@ def get_employee(emp_id: int, db: Session = Depends(get_db)):
         HTTPException: If employee is not found.
 
     Returns:
-        EmployeeOut: The employee object.
+        EmployeeOut: The employee object (or an empty 304 response).
     """
     employee = crud.get_employee(db, emp_id)
     if employee is None:
         raise HTTPException(status_code=404, detail="Employee Not Found")
-    return employee
+
+    etag = employee_etag(employee)
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers={"ETag": etag})
+    return ORJSONResponse(employee, headers={"ETag": etag})
 
 
 # 4. Update an Employee
-@app.put('/employees/{emp_id}', response_model=schemas.EmployeeOut)
+@app.put('/employees/{emp_id}', responses={200: {"model": schemas.EmployeeOut}})
 def update_employee(emp_id: int, employee: schemas.EmployeeUpdate, db: Session = Depends(get_db)):
     """
     Update an existing employee by ID.
@@ -102,7 +157,7 @@ def update_employee(emp_id: int, employee: schemas.EmployeeUpdate, db: Session =
     db_employee = crud.update_employee(db, emp_id, employee)
     if db_employee is None:
         raise HTTPException(status_code=404, detail="Employee Not Found")
-    return db_employee
+    return ORJSONResponse(db_employee.model_dump())
 
 
 # 5. Delete an Employee
@@ -120,7 +175,7 @@ def delete_employee(emp_id: int, db: Session = Depends(get_db)):
     Returns:
         dict: Confirmation message.
     """
-    employee = crud.delete_employee(db, emp_id)
-    if employee is None:
+    deleted_id = crud.delete_employee(db, emp_id)
+    if deleted_id is None:
         raise HTTPException(status_code=404, detail="Employee Not Found")
     return {"detail": "Employee Deleted"}
@@ -8,7 +8,14 @@ Schemas ensure that data exchanged via the API follows the correct format.
 They also act as a contract between the backend and the client.
 """
 
-from pydantic import BaseModel, EmailStr
+import re
+
+from pydantic import BaseModel, ConfigDict, field_validator
+
+# Precompiled email shape check: something@domain.tld, no whitespace.
+# Much cheaper per request than `EmailStr`, which runs the full
+# `email-validator` parsing/normalization on every inbound payload.
+EMAIL_PATTERN = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
 
 
 class EmployeeBase(BaseModel):
@@ -17,10 +24,23 @@ class EmployeeBase(BaseModel):
 
     Attributes:
         name (str): Name of the employee.
-        email (EmailStr): Valid email address of the employee.
+        email (str): Valid email address of the employee.
     """
     name: str
-    email: EmailStr
+    email: str
+
+    @field_validator("email")
+    @classmethod
+    def check_email(cls, value: str) -> str:
+        """
+        Validate the email address against `EMAIL_PATTERN`.
+
+        Raises:
+            ValueError: If the value does not look like an email address.
+        """
+        if not EMAIL_PATTERN.match(value):
+            raise ValueError("value is not a valid email address")
+        return value
 
 
 class EmployeeCreate(EmployeeBase):
@@ -49,5 +69,5 @@ class EmployeeOut(EmployeeBase):
 
     id: int
 
-    class Config:
-        orm_mode = True  # Allows compatibility with SQLAlchemy ORM objects
+    # Allows compatibility with SQLAlchemy ORM objects (pydantic v2 replacement for `orm_mode`)
+    model_config = ConfigDict(from_attributes=True)
@@ -19,6 +19,25 @@ How to run:
 -----------
     uvicorn main:app --reload
 
+Model loading:
+--------------
+The model is loaded (and warmed up with one dummy prediction) in the `lifespan`
+handler, before the app accepts requests, and kept on `app.state.model`.
+Every worker process does this once at startup instead of on its first request.
+
+Micro-batching:
+---------------
+`/prediction` requests arriving within a couple of milliseconds of each other
+are scored together in one model call by the `MicroBatcher` started in `lifespan`.
+
+Concurrency:
+------------
+The endpoints are `async def`: request validation and response serialization
+run on the event loop, and only the CPU-bound scoring (building the feature
+matrix and running the Numba `linear_predict` kernel, see predict.py) is sent
+to a worker thread with `asyncio.to_thread`. The kernel releases the GIL, so
+batches scored in different threads don't block each other.
+
 Example Single Request (JSON):
 {
     "longitude": -122.23,
@@ -38,25 +57,75 @@ Example Single Response (JSON):
 
 """
 
-from fastapi import FastAPI
+import asyncio
+from contextlib import asynccontextmanager
+
+import msgspec
+import numpy as np
+from fastapi import Depends, FastAPI, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse
 from ml_model.schemas import InputSchema, OutputSchema  # Request/response validation
-from ml_model.predict import make_predictions, make_batch_predictions  # ML model inference functions
+from ml_model.predict import MicroBatcher, load_model, make_batch_predictions  # ML model inference functions
 from typing import List
 
+
+# -------------------------------------------------------------------------
+# msgspec request bodies
+# The schemas are msgspec Structs, so FastAPI can't parse them itself: the raw
+# body is decoded and validated by msgspec, and documented explicitly in OpenAPI.
+# -------------------------------------------------------------------------
+def msgspec_body(body_type):
+    # Dependency that decodes the request body into `body_type` with msgspec
+    decoder = msgspec.json.Decoder(body_type)
+
+    async def decode(request: Request):
+        try:
+            return decoder.decode(await request.body())
+        except msgspec.DecodeError as exc:  # also covers msgspec.ValidationError
+            raise HTTPException(status_code=422, detail=str(exc))
+
+    return decode
+
+
+_, _components = msgspec.json.schema_components([InputSchema, OutputSchema])
+input_schema = _components["InputSchema"]
+output_schema = _components["OutputSchema"]
+
+
+def openapi_docs(request_schema: dict, response_schema: dict) -> dict:
+    # Request body and 200 response of an endpoint, as `@app.post(**openapi_docs(...))` kwargs
+    return {
+        "openapi_extra": {"requestBody": {"required": True, "content": {"application/json": {"schema": request_schema}}}},
+        "responses": {200: {"content": {"application/json": {"schema": response_schema}}}},
+    }
+
+
+# -------------------------------------------------------------------------
+# Lifespan: load the model once per worker, before serving requests
+# -------------------------------------------------------------------------
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    app.state.model = load_model("model.joblib")
+    app.state.batcher = MicroBatcher(app.state.model)
+    app.state.batcher.start()
+    yield
+    await app.state.batcher.stop()
+
 # -------------------------------------------------------------------------
 # Initialize FastAPI application
 # -------------------------------------------------------------------------
 app = FastAPI(
     title="ML Model Prediction API",
     description="This API provides endpoints for single and batch predictions using a trained ML model.",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # -------------------------------------------------------------------------
 # Root Endpoint (Health Check)
 # -------------------------------------------------------------------------
 @app.get("/")
-def index():
+async def index() -> dict[str, str]:
     """
     Root endpoint to confirm API is running.
 
@@ -69,40 +138,59 @@ def index():
 # -------------------------------------------------------------------------
 # Endpoint: Single Prediction
 # -------------------------------------------------------------------------
-@app.post("/prediction", response_model=OutputSchema)
-def predict(user_input: InputSchema):
+@app.post("/prediction", **openapi_docs(input_schema, output_schema))
+async def predict(request: Request, user_input: InputSchema = Depends(msgspec_body(InputSchema))):
     """
     Generate a single prediction from one input payload.
 
     Args:
         user_input (InputSchema): Validated input data.
+        request (Request): Gives access to the micro-batcher started at startup.
 
     Returns:
         OutputSchema: Predicted house price (rounded to 2 decimals).
     """
-    # Convert validated Pydantic object into a dictionary
-    prediction = make_predictions(user_input.model_dump())
+    # The micro-batcher scores the validated input Struct
+    # together with concurrent requests (off the event loop)
+    prediction = await request.app.state.batcher.predict(user_input)
 
-    # Return prediction wrapped in OutputSchema
-    return OutputSchema(predicted_price=round(prediction, 2))
+    # Return prediction wrapped in OutputSchema, encoded by msgspec
+    return Response(
+        content=msgspec.json.encode(OutputSchema(predicted_price=round(prediction, 2))),
+        media_type="application/json"
+    )
 
 
 # -------------------------------------------------------------------------
 # Endpoint: Batch Predictions
 # -------------------------------------------------------------------------
-@app.post("/batch_prediction", response_model=List[OutputSchema])
-def batch_predict(user_inputs: List[InputSchema]):
+# No response_model: the outputs are built from trusted model predictions, so FastAPI
+# doesn't need to re-validate or jsonable-encode every item (the schema is still
+# documented via `responses`); orjson serializes the list in C
+@app.post(
+    "/batch_prediction",
+    **openapi_docs({"type": "array", "items": input_schema}, {"type": "array", "items": output_schema})
+)
+async def batch_predict(
+    request: Request, user_inputs: List[InputSchema] = Depends(msgspec_body(List[InputSchema]))
+):
     """
     Generate predictions for multiple input payloads at once.
 
     Args:
         user_inputs (List[InputSchema]): List of validated input data.
+        request (Request): Gives access to the model loaded at startup.
 
     Returns:
-        List[OutputSchema]: List of predicted house prices (rounded to 2 decimals).
+        ORJSONResponse: List of predicted house prices in the OutputSchema shape (rounded to 2 decimals).
     """
-    # Convert list of Pydantic objects to list of dictionaries
-    predictions = make_batch_predictions([x.model_dump() for x in user_inputs])
-
-    # Wrap predictions in OutputSchema objects
-    return [OutputSchema(predicted_price=round(prediction, 2)) for prediction in predictions]
+    # Features are read straight off the input Structs; run inference off the event loop
+    predictions = await asyncio.to_thread(
+        make_batch_predictions, request.app.state.model, user_inputs
+    )
+
+    # Round the whole array at once; return plain dicts with the OutputSchema shape
+    return ORJSONResponse([
+        {"predicted_price": prediction}
+        for prediction in np.round(predictions, 2).tolist()
+    ])
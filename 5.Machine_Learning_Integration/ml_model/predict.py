@@ -4,10 +4,19 @@ predict.py — Inference utilities for the ML Prediction API.
 Purpose:
 --------
 This file is responsible for:
-1. Loading the serialized (trained) ML model from `model.joblib`.
-2. Defining utility functions to generate predictions:
+1. Loading the serialized (trained) ML model from `model.joblib` (`load_model`,
+   called once at application startup).
+2. Defining utility functions to generate predictions with that model:
    - Single prediction (for one input record).
    - Batch prediction (for multiple input records at once).
+3. Micro-batching concurrent single predictions into one model call (`MicroBatcher`).
+
+Inference kernel:
+-----------------
+The model is a LinearRegression, so a prediction is just `X @ coef_ + intercept_`.
+Instead of `model.predict` (input validation + generic dispatch on every call),
+predictions are computed by `linear_predict`, a Numba-compiled loop over the
+8 features. It releases the GIL, so batches scored in worker threads run in parallel.
 
 Why important?
 --------------
@@ -18,72 +27,238 @@ Why important?
 
 """
 
+import asyncio
+from collections import OrderedDict
+from contextlib import suppress
+from itertools import chain
+from operator import attrgetter
+from typing import List
+
 import joblib
 import numpy as np
-from typing import List
+from numba import njit
+
+from ml_model.schemas import InputSchema
+
+# Model features, in the column order used for training
+FEATURES = (
+    "longitude",
+    "latitude",
+    "housing_median_age",
+    "total_rooms",
+    "total_bedrooms",
+    "population",
+    "households",
+    "median_income",
+)
+
+# Reads all feature values of one validated InputSchema as a tuple in a single
+# C-level call (no intermediate dict per record)
+get_features = attrgetter(*FEATURES)
+
+
+# -------------------------------------------------------------------------
+# Linear model kernel (compiled to machine code by Numba)
+# -------------------------------------------------------------------------
+@njit(fastmath=True, cache=True, nogil=True)
+def _linear_kernel(X, coef, intercept, out):
+    for i in range(X.shape[0]):
+        total = intercept
+        for j in range(X.shape[1]):
+            total += X[i, j] * coef[j]
+        out[i] = total
+
+
+def linear_predict(model, X: np.ndarray) -> np.ndarray:
+    """
+    Equivalent of `model.predict(X)` for a fitted LinearRegression.
+
+    Args:
+        model: The fitted estimator returned by `load_model`.
+        X (np.ndarray): 2D feature matrix (m rows, n features).
+
+    Returns:
+        np.ndarray: One prediction per row.
+    """
+    out = np.empty(X.shape[0])
+    _linear_kernel(X, model.coef_, model.intercept_, out)
+    return out
+
 
 # -------------------------------------------------------------------------
 # Step 1: Load the trained ML model from disk
 # -------------------------------------------------------------------------
-saved_model = joblib.load("model.joblib")
-print("✅ Loaded the trained model from 'model.joblib'")
+def load_model(path: str = "model.joblib"):
+    """
+    Load the trained model and warm it up.
+
+    Args:
+        path (str): Location of the serialized model.
+
+    Returns:
+        The fitted scikit-learn estimator.
+
+    Note:
+        The coefficients are converted once to a contiguous float64 array and
+        the intercept to a plain float, the exact types the kernel is compiled
+        for, so no per-call conversion is needed. One dummy prediction is then
+        run, so the first real request doesn't pay for compiling (or loading
+        the cached build of) the Numba kernel.
+    """
+    model = joblib.load(path)
+    model.coef_ = np.ascontiguousarray(model.coef_, dtype=np.float64)
+    model.intercept_ = float(model.intercept_)
+    linear_predict(model, np.zeros((1, len(FEATURES))))
+    print(f"✅ Loaded the trained model from '{path}'")
+    return model
 
 
 # -------------------------------------------------------------------------
 # Step 2: Define function for single prediction
 # -------------------------------------------------------------------------
-def make_predictions(data: dict) -> float:
+def make_predictions(model, data: InputSchema) -> float:
     """
     Generate prediction for a single input record.
 
     Args:
-        data (dict): A dictionary containing the input features required
-                     by the ML model.
+        model: The fitted estimator returned by `load_model`.
+        data (InputSchema): The validated input features required
+                            by the ML model.
 
     Returns:
         float: The predicted value (e.g., house price).
     """
-    # Convert dictionary to a 2D NumPy array (1 row, n features)
-    features = np.array([[
-        data["longitude"],
-        data["latitude"],
-        data["housing_median_age"],
-        data["total_rooms"],
-        data["total_bedrooms"],
-        data["population"],
-        data["households"],
-        data["median_income"]
-    ]])
+    # Convert the record to a 2D NumPy array (1 row, n features)
+    features = np.array([get_features(data)], dtype=np.float64)
 
     # Return the first (and only) prediction
-    return saved_model.predict(features)[0]
+    return linear_predict(model, features)[0]
 
 
 # -------------------------------------------------------------------------
 # Step 3: Define function for batch prediction
 # -------------------------------------------------------------------------
-def make_batch_predictions(data: List[dict]) -> np.ndarray:
+def make_batch_predictions(model, data: List[InputSchema]) -> np.ndarray:
     """
     Generate predictions for multiple input records at once.
 
     Args:
-        data (List[dict]): A list of dictionaries, where each dictionary
-                           contains the input features required by the ML model.
+        model: The fitted estimator returned by `load_model`.
+        data (List[InputSchema]): A list of validated records, each containing
+                                  the input features required by the ML model.
 
     Returns:
         np.ndarray: A NumPy array containing predictions for each record.
     """
-    # Convert list of dictionaries to a 2D NumPy array (m rows, n features)
-    X = np.array([[
-        x["longitude"],
-        x["latitude"],
-        x["housing_median_age"],
-        x["total_rooms"],
-        x["total_bedrooms"],
-        x["population"],
-        x["households"],
-        x["median_income"]
-    ] for x in data])
+    if not data:
+        return np.empty(0)
+
+    # Convert the records to a 2D NumPy array (m rows, n features): the feature
+    # values stream straight into one preallocated block (count is known up front),
+    # without an intermediate list of per-record tuples
+    X = np.fromiter(
+        chain.from_iterable(map(get_features, data)),
+        dtype=np.float64,
+        count=len(data) * len(FEATURES),
+    ).reshape(len(data), len(FEATURES))
 
     # Return predictions for all rows
-    return saved_model.predict(X)
\ No newline at end of file
+    return linear_predict(model, X)
+
+
+# -------------------------------------------------------------------------
+# Step 4: Micro-batching of single predictions
+# -------------------------------------------------------------------------
+class MicroBatcher:
+    """
+    Coalesce concurrent single-record predictions into one batched model call.
+
+    Each `predict` call queues its record with a future and waits; a single
+    background task takes the first waiting record, gives concurrent requests
+    `max_wait` seconds to join, then scores up to `max_batch` records with one
+    `make_batch_predictions` call and resolves every future with its result.
+    The fixed per-call cost (thread hand-off, array build, kernel call) is
+    paid once per batch instead of once per request.
+
+    Results are kept in an LRU cache keyed on the 8 feature values
+    (`cache_size` entries), so a repeated identical request is answered
+    immediately, without waiting for a batch. `cache_hits` / `cache_misses`
+    count lookups and help size the cache.
+
+    Usage:
+        batcher = MicroBatcher(model)
+        batcher.start()                          # inside the running event loop
+        price = await batcher.predict(record)
+        await batcher.stop()
+    """
+
+    def __init__(self, model, max_batch: int = 64, max_wait: float = 0.002, cache_size: int = 65536):
+        self.model = model
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.cache_size = cache_size
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self._cache: OrderedDict = OrderedDict()
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        """Start the background batching task on the running event loop."""
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Cancel the background batching task and wait for it to finish."""
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+
+    async def predict(self, data: InputSchema) -> float:
+        """
+        Queue one record and wait for its prediction.
+
+        Args:
+            data (InputSchema): The validated input features.
+
+        Returns:
+            float: The predicted value.
+        """
+        key = get_features(data)
+        prediction = self._cache.get(key)
+        if prediction is not None:
+            self._cache.move_to_end(key)  # mark as most recently used
+            self.cache_hits += 1
+            return prediction
+        self.cache_misses += 1
+
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((data, future))
+        prediction = await future
+
+        self._cache[key] = prediction
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)  # evict the least recently used entry
+        return prediction
+
+    async def _run(self) -> None:
+        while True:
+            batch = [await self.queue.get()]
+            if self.max_wait:
+                await asyncio.sleep(self.max_wait)  # let concurrent requests join the batch
+            while len(batch) < self.max_batch and not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+
+            try:
+                predictions = await asyncio.to_thread(
+                    make_batch_predictions, self.model, [data for data, _ in batch]
+                )
+            except Exception as exc:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(exc)
+                continue
+
+            for (_, future), prediction in zip(batch, predictions):
+                if not future.done():  # the request may have been cancelled meanwhile
+                    future.set_result(float(prediction))
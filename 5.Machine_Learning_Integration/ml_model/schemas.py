@@ -33,14 +33,33 @@ Example Output (JSON):
 
 """
 
-from pydantic import BaseModel, StrictInt, Field
+from typing import Annotated, Union
+
+import msgspec
+
+# msgspec Structs instead of pydantic models: the JSON request body is parsed
+# and validated (types + `gt=0` constraints) by msgspec's C decoder in one pass.
+# msgspec is strict by default -> int fields reject "41" or 41.0 (like pydantic's StrictInt)
+PositiveInt = Annotated[int, msgspec.Meta(gt=0)]
+PositiveFloat = Annotated[float, msgspec.Meta(gt=0)]
+
+# Fields that were lax pydantic `int`s: clients (e.g. rows dumped from pandas) send
+# them as 41.0 or "41". They are decoded as-is and converted in `__post_init__` with
+# msgspec's lax rules: integral floats, numeric strings and booleans become ints,
+# 41.5 or "abc" are rejected.
+LaxPositiveInt = Annotated[
+    Union[int, float, str, bool],
+    msgspec.Meta(extra_json_schema={"description": "Integer > 0 (41.0 and \"41\" are accepted)"}),
+]
+LAX_INT_FIELDS = ("housing_median_age", "population")
+
 
 # -------------------------------------------------------------------------
 # Input Schema
 # Defines the structure and validation rules for the features
 # that will be passed to the ML model for prediction.
 # -------------------------------------------------------------------------
-class InputSchema(BaseModel):
+class InputSchema(msgspec.Struct):
     """
     Schema for model input features.
 
@@ -56,19 +75,32 @@ class InputSchema(BaseModel):
     """
     longitude: float
     latitude: float
-    housing_median_age: int = Field(..., gt=0)
-    total_rooms: StrictInt = Field(..., gt=0)
-    total_bedrooms: StrictInt = Field(..., gt=0)
-    population: int = Field(..., gt=0)
-    households: StrictInt = Field(..., gt=0)
-    median_income: float = Field(..., gt=0)
+    housing_median_age: LaxPositiveInt
+    total_rooms: PositiveInt
+    total_bedrooms: PositiveInt
+    population: LaxPositiveInt
+    households: PositiveInt
+    median_income: PositiveFloat
+
+    def __post_init__(self):
+        # Same coercion pydantic's lax `int` did for these two fields
+        for name in LAX_INT_FIELDS:
+            value = getattr(self, name)
+            if isinstance(value, bool):
+                value = int(value)
+            elif isinstance(value, str):
+                value = value.strip()
+            try:
+                setattr(self, name, msgspec.convert(value, PositiveInt, strict=False))
+            except msgspec.ValidationError as exc:
+                raise ValueError(f"{exc} - at `$.{name}`") from None
 
 
 # -------------------------------------------------------------------------
 # Output Schema
 # Defines the structure of the response returned by the ML model prediction.
 # -------------------------------------------------------------------------
-class OutputSchema(BaseModel):
+class OutputSchema(msgspec.Struct):
     """
     Schema for model prediction output.
 
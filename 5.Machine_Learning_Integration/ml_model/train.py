@@ -4,7 +4,7 @@ train.py — Training script for the ML Prediction API.
 Purpose:
 --------
 This file is responsible for:
-1. Loading and preprocessing the dataset.
+1. Loading and preprocessing the dataset (cached as Parquet, rebuilt whenever the CSV changes).
 2. Training a machine learning model (Linear Regression in this case).
 3. Serializing and saving the trained model as a `.joblib` file for later use
    in prediction (via `predict.py` and FastAPI endpoints).
@@ -17,6 +17,8 @@ Why important?
 
 """
 
+import os
+
 import joblib
 import pandas as pd
 from sklearn.linear_model import LinearRegression
@@ -27,15 +29,41 @@ from sklearn.linear_model import LinearRegression
 # -------------------------------------------------------------------------
 file_path = r"D:\16_FastAPI\housing.csv"
 
-# Read CSV, drop null values, and ignore the last column (if not needed)
-df = pd.read_csv(file_path).iloc[:, :-1].dropna()
+# Columnar copy of the CSV, written on the first run and reused while it is
+# at least as new as the CSV (an edited or replaced CSV rebuilds it)
+parquet_path = os.path.splitext(file_path)[0] + ".parquet"
+
+# Columns used for training (the last CSV column, `ocean_proximity`, is not needed)
+FEATURES = [
+    "longitude",
+    "latitude",
+    "housing_median_age",
+    "total_rooms",
+    "total_bedrooms",
+    "population",
+    "households",
+    "median_income",
+]
+TARGET = "median_house_value"
+COLUMNS = FEATURES + [TARGET]
+
+if os.path.exists(parquet_path) and os.path.getmtime(parquet_path) >= os.path.getmtime(file_path):
+    # Parquet is columnar and typed: only the needed columns are read, no text parsing
+    df = pd.read_parquet(parquet_path, columns=COLUMNS)
+else:
+    # Parse only the needed columns, with their dtype given up front
+    df = pd.read_csv(file_path, usecols=COLUMNS, dtype={col: "float64" for col in COLUMNS})
+    df.to_parquet(parquet_path, index=False)
+
+# Drop null values
+df = df.dropna()
 print("✅ Dataset loaded successfully")
 
 # -------------------------------------------------------------------------
 # Step 2: Split dataset into features (X) and target (y)
 # -------------------------------------------------------------------------
-X = df.drop(columns="median_house_value")  # Features
-y = df["median_house_value"].copy()        # Target variable
+X = df[FEATURES]  # Features
+y = df[TARGET]    # Target variable
 print("✅ Dataset split into features and target")
 
 # -------------------------------------------------------------------------
@@ -49,5 +77,7 @@ print("✅ Model trained successfully")
 # Step 4: Serialize (save) the trained model
 # This file will later be used by `predict.py` for inference.
 # -------------------------------------------------------------------------
-joblib.dump(model, "model.joblib")
+# compress=3: zlib level 3 keeps the file small (faster to read on cold start)
+# while staying quick to decompress. Compressed files cannot be memory-mapped.
+joblib.dump(model, "model.joblib", compress=3)
 print("✅ Model saved as 'model.joblib'")
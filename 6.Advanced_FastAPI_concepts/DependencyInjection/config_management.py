@@ -16,46 +16,56 @@ Concept:
 --------
 - Define a `Settings` class that holds configuration values.
 - Use a dependency function (`get_settings`) to provide an instance of `Settings`.
+- Cache `get_settings` with `lru_cache` so the settings are built once per process,
+  not once per request.
 - Inject the configuration into any endpoint using `Depends`.
 
 Flow:
 -----
 1. A client requests `/config`.
 2. FastAPI sees `settings: Settings = Depends(get_settings)`.
-3. `get_settings()` is executed, returning a `Settings` object.
+3. `get_settings()` is executed, returning the cached `Settings` object
+   (created on the first call only).
 4. The endpoint receives this `settings` object as an argument.
 5. The endpoint can now safely access configuration values (e.g., API key).
 
 """
 
+from functools import lru_cache
+
 from fastapi import FastAPI, Depends
+from pydantic_settings import BaseSettings
 
 # Initialize FastAPI app
 app = FastAPI()
 
 
-class Settings:
+class Settings(BaseSettings):
     """
     Application settings class.
 
+    Values are read from environment variables (e.g. `API_KEY`, `DEBUG`)
+    and fall back to the defaults below.
+
     Attributes:
         api_key (str): A secret API key (mocked here).
         debug (bool): Flag to enable/disable debug mode.
     """
-
-    def __init__(self):
-        # In a real-world scenario, these values may come from
-        # environment variables or config files.
-        self.api_key = 'my_secret'
-        self.debug = True
+    api_key: str = 'my_secret'
+    debug: bool = True
 
 
+@lru_cache(maxsize=1)
 def get_settings():
     """
     Dependency function that returns application settings.
 
+    The environment is parsed only on the first call; every later request
+    reuses the same cached instance. In tests, swap it out with
+    `app.dependency_overrides[get_settings] = lambda: Settings(api_key='test')`.
+
     Returns:
-        Settings: An instance of the Settings class.
+        Settings: The shared instance of the Settings class.
     """
     return Settings()
 
@@ -37,6 +37,8 @@ This is only a **demo**. In real-world apps:
 
 """
 
+import secrets
+
 from fastapi import FastAPI, Depends, Form, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 
@@ -46,6 +48,12 @@ app = FastAPI()
 # OAuth2PasswordBearer will read tokens from the "Authorization: Bearer <token>" header.
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl='token')
 
+# The only valid token and the user it decodes to, built once at import time.
+# The user dict is shared by all requests, so treat it as read-only.
+VALID_TOKEN = 'valid_token'
+VALID_TOKEN_BYTES = VALID_TOKEN.encode()  # compare_digest only accepts ASCII str, bytes are always safe
+VALID_USER = {'name': 'john'}
+
 
 @app.post('/token')
 def login(username: str = Form(...), password: str = Form(...)):
@@ -64,7 +72,7 @@ def login(username: str = Form(...), password: str = Form(...)):
         - Otherwise, raise HTTP 400 (Bad Request) with 'Invalid Credentials'.
     """
     if username == 'john' and password == 'pass123':
-        return {'access_token': 'valid_token', 'token_type': 'bearer'}
+        return {'access_token': VALID_TOKEN, 'token_type': 'bearer'}
 
     # Invalid credentials → raise error
     raise HTTPException(status_code=400, detail='Invalid Credentials')
@@ -81,11 +89,13 @@ def decode_token(token: str):
         dict: A mock user dictionary if the token is valid.
 
     Logic:
-        - If token equals 'valid_token', return a fake user (john).
+        - If token equals 'valid_token', return the fake user (john).
+          `secrets.compare_digest` takes the same time wherever the strings
+          differ, so the token can't be guessed from response timings.
         - Otherwise, raise HTTP 401 Unauthorized.
     """
-    if token == 'valid_token':
-        return {'name': 'john'}
+    if secrets.compare_digest(token.encode(), VALID_TOKEN_BYTES):
+        return VALID_USER
 
     # Invalid token → raise 401 Unauthorized
     raise HTTPException(
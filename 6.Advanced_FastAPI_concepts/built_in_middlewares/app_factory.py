@@ -0,0 +1,150 @@
+"""
+app_factory.py — Shared FastAPI application factory for the middleware demos
+
+Purpose:
+--------
+The CORS, GZip and HTTPS demos used to each repeat the same `FastAPI(...)` setup
+and their own `add_middleware` calls. `create_app` builds the app in one place
+and mounts only the middlewares that are switched on.
+
+Usage:
+------
+    app = create_app(gzip=True, title="FastAPI with GZip Middleware")
+
+Middleware order:
+-----------------
+The last middleware added is the outermost one, so they are added as
+GZip → CORS → HTTPS redirect:
+- HTTPS redirect runs first and rejects plain-HTTP requests before any other work.
+- CORS answers preflights before anything is compressed.
+- GZip compresses the final response body.
+
+Adding your own middleware:
+---------------------------
+The built-in middlewares above are plain ASGI classes. `@app.middleware("http")`
+(and `BaseHTTPMiddleware`) instead run the rest of the app in an extra task and
+stream the response through a memory channel on every request, a cost that
+grows with each layer stacked. Copy this pure-ASGI template instead
+(`../custom_middlewares/custom_middleware.py` has a complete example):
+
+    class FastMiddleware:
+        def __init__(self, app):
+            self.app = app
+
+        async def __call__(self, scope, receive, send):
+            if scope["type"] != "http":
+                return await self.app(scope, receive, send)
+            # ... pre-work (synchronous, no task creation)
+            await self.app(scope, receive, send)
+
+    app = create_app(cors=True)
+    app.add_middleware(FastMiddleware)
+
+"""
+
+from fastapi import FastAPI
+from fastapi.middleware.cors import CORSMiddleware
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.middleware.httpsredirect import HTTPSRedirectMiddleware
+from starlette.responses import Response
+from starlette.types import ASGIApp
+
+
+# -------------------------------------------------------------------------
+# CORS middleware with cached preflight responses
+# -------------------------------------------------------------------------
+class CachedCORSMiddleware(CORSMiddleware):
+    """
+    Drop-in `CORSMiddleware` that does its per-request work once, at startup.
+
+    Starlette already joins the allow-methods/allow-headers strings in `__init__`;
+    what it still does on every preflight is rebuild the header dict and response.
+    This subclass additionally:
+    - keeps allowed origins, methods and headers in frozensets (O(1) lookups),
+    - builds the successful preflight response once per allowed origin and
+      reuses it (only when `allow_headers` is an explicit list, because with
+      `"*"` the requested headers must be reflected back per request).
+    Simple (non-preflight) responses go through Starlette's own `send` unchanged.
+    """
+
+    def __init__(self, app: ASGIApp, **options) -> None:
+        super().__init__(app, **options)
+        self.allow_origins = frozenset(self.allow_origins)
+        self.allow_methods = frozenset(self.allow_methods)
+        self._allow_headers_set = frozenset(self.allow_headers)
+        self._preflight_ok: dict[str, Response] = {}
+
+    def _headers_allowed(self, requested_headers: str) -> bool:
+        return all(
+            header.strip().lower() in self._allow_headers_set
+            for header in requested_headers.split(",")
+        )
+
+    def preflight_response(self, request_headers: Headers) -> Response:
+        origin = request_headers["origin"]
+        requested_headers = request_headers.get("access-control-request-headers")
+        cacheable = (
+            not self.allow_all_headers
+            and origin in self.allow_origins
+            and request_headers["access-control-request-method"] in self.allow_methods
+            and "access-control-request-private-network" not in request_headers
+            and (requested_headers is None or self._headers_allowed(requested_headers))
+        )
+        if not cacheable:
+            return super().preflight_response(request_headers)
+
+        # A successful preflight only depends on the origin here, so build it once
+        response = self._preflight_ok.get(origin)
+        if response is None:
+            response = self._preflight_ok[origin] = super().preflight_response(request_headers)
+        return response
+
+
+# -------------------------------------------------------------------------
+# Middleware settings
+# -------------------------------------------------------------------------
+CORS_OPTIONS = dict(
+    allow_origins=[
+        "https://my-frontend.com",  # Production frontend
+        "http://localhost:3000"     # Local development frontend
+    ],
+    allow_credentials=True,          # Allow cookies/auth headers
+    allow_methods=["GET", "POST", "PUT", "DELETE"],  # Allowed HTTP methods
+    # Explicit list instead of "*": with credentials, "*" forces the middleware to
+    # reflect each preflight's requested headers back, so no response can be reused
+    allow_headers=["Authorization", "Content-Type", "X-Requested-With", "Accept"]
+)
+
+GZIP_OPTIONS = dict(
+    minimum_size=1500,  # Only compress responses larger than 1500 bytes (small replies gain little)
+    compresslevel=1     # Fastest zlib level (default is 9, the slowest): CPU-light, most of the size win
+)
+
+
+# -------------------------------------------------------------------------
+# Factory
+# -------------------------------------------------------------------------
+def create_app(*, cors: bool = False, gzip: bool = False, https: bool = False, **app_options) -> FastAPI:
+    """
+    Build a FastAPI app with the selected built-in middlewares.
+
+    Args:
+        cors (bool): Add `CachedCORSMiddleware` configured with `CORS_OPTIONS`.
+        gzip (bool): Add `GZipMiddleware` configured with `GZIP_OPTIONS`.
+        https (bool): Add `HTTPSRedirectMiddleware`.
+        **app_options: Passed to `FastAPI(...)` (title, description, version, ...).
+
+    Returns:
+        FastAPI: The configured application.
+    """
+    app = FastAPI(**app_options)
+
+    if gzip:
+        app.add_middleware(GZipMiddleware, **GZIP_OPTIONS)
+    if cors:
+        app.add_middleware(CachedCORSMiddleware, **CORS_OPTIONS)
+    if https:
+        app.add_middleware(HTTPSRedirectMiddleware)  # Redirect all HTTP requests to HTTPS
+
+    return app
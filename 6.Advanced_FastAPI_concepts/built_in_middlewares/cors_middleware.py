@@ -13,33 +13,41 @@ Why important?
 - Allows controlled cross-origin requests (security).
 - Defines which origins, methods, and headers are permitted.
 
+Performance:
+------------
+- `CachedCORSMiddleware` (see `app_factory.py`) moves the per-request CORS work
+  (origin lookups, header dict rebuilds, preflight response construction) to startup.
+
+Configuration:
+--------------
+The app is built by `app_factory.create_app(cors=True)`; the allowed origins,
+methods and headers live in `app_factory.CORS_OPTIONS`.
+
 """
 
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
+import orjson
+from fastapi import Response
+
+from app_factory import create_app
 
 # -------------------------------------------------------------------------
-# Initialize FastAPI app
+# Initialize FastAPI app with CORS Middleware
 # -------------------------------------------------------------------------
-app = FastAPI(
+app = create_app(
+    cors=True,
     title="FastAPI with CORS Middleware",
     description="An example FastAPI app with CORS enabled for frontend integration.",
     version="1.0.0"
 )
 
 # -------------------------------------------------------------------------
-# Configure CORS Middleware
+# Root response
+# Built once at import time: the reply never changes, and a Response can be
+# sent any number of times, so requests skip JSON encoding and header building.
 # -------------------------------------------------------------------------
-
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=[
-        "https://my-frontend.com",  # Production frontend
-        "http://localhost:3000"     # Local development frontend
-    ],
-    allow_credentials=True,          # Allow cookies/auth headers
-    allow_methods=["GET", "POST", "PUT", "DELETE"],  # Allowed HTTP methods
-    allow_headers=["*"]              # Allow all headers (can restrict if needed)
+ROOT_RESPONSE = Response(
+    content=orjson.dumps({"message": "CORS-enabled FastAPI app is running 🚀"}),
+    media_type="application/json"
 )
 
 # -------------------------------------------------------------------------
@@ -50,4 +58,4 @@ def root():
     """
     Root endpoint to test if CORS is working.
     """
-    return {"message": "CORS-enabled FastAPI app is running 🚀"}
+    return ROOT_RESPONSE
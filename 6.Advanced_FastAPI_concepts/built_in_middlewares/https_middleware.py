@@ -15,23 +15,29 @@ Why important?
 
 """
 
-from fastapi import FastAPI
-from starlette.middleware.httpsredirect import HTTPSRedirectMiddleware
+import orjson
+from fastapi import Response
+
+from app_factory import create_app
 
 # -------------------------------------------------------------------------
-# Initialize FastAPI app
+# Initialize FastAPI app with HTTPS Redirect Middleware
 # -------------------------------------------------------------------------
-app = FastAPI(
+app = create_app(
+    https=True,  # Redirect all HTTP requests to HTTPS
     title="FastAPI with HTTPS Redirection",
     description="An example FastAPI app that automatically redirects HTTP requests to HTTPS.",
     version="1.0.0"
 )
 
 # -------------------------------------------------------------------------
-# Add HTTPS Redirect Middleware
+# Root response
+# Built once at import time: the reply never changes, and a Response can be
+# sent any number of times, so requests skip JSON encoding and header building.
 # -------------------------------------------------------------------------
-app.add_middleware(
-    HTTPSRedirectMiddleware  # Redirect all HTTP requests to HTTPS
+ROOT_RESPONSE = Response(
+    content=orjson.dumps({"message": "HTTPS redirect middleware is active 🚀"}),
+    media_type="application/json"
 )
 
 # -------------------------------------------------------------------------
@@ -43,4 +49,4 @@ def root():
     Root endpoint to test HTTPS redirection.
     If accessed via HTTP, the request will be redirected to HTTPS automatically.
     """
-    return {"message": "HTTPS redirect middleware is active 🚀"}
+    return ROOT_RESPONSE
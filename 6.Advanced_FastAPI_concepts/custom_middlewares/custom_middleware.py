@@ -2,8 +2,8 @@
 FastAPI Custom Middleware Example
 =================================
 
-This file demonstrates how to create and use **multiple custom middlewares** in FastAPI
-by extending Starlette's `BaseHTTPMiddleware`.
+This file demonstrates how to create and use a **custom middleware** in FastAPI
+as a plain (pure) ASGI class.
 
 Middleware in FastAPI/Starlette allows you to execute logic before and/or after 
 a request is processed by your application. They are particularly useful for:
@@ -13,24 +13,27 @@ a request is processed by your application. They are particularly useful for:
     - Adding or modifying headers
     - Error handling
 
-Middlewares implemented here:
------------------------------
-1. TimerMiddleware:
-   - Measures how long each request takes to be processed.
-   - Logs the duration in seconds.
+Middleware implemented here:
+----------------------------
+ObservabilityMiddleware:
+   - Logs HTTP method, URL path, client IP and response status of each request.
+   - Measures how long each request takes to be processed (in seconds).
+   - Useful for debugging, monitoring and request auditing.
 
-2. LoggingMiddleware:
-   - Logs HTTP method, URL path, and client IP of each request.
-   - Useful for debugging and request auditing.
+Why pure ASGI instead of `BaseHTTPMiddleware`?
+----------------------------------------------
+Every `BaseHTTPMiddleware` layer runs the rest of the app in an extra task and
+pipes the response through an anyio memory stream. Stacking two of them (one
+for logging, one for timing) pays that cost twice per request. A class with an
+`async __call__(scope, receive, send)` just wraps the next ASGI app directly.
 
 Flow of Execution:
 ------------------
 1. Request enters the application.
-2. LoggingMiddleware runs → logs method, path, and client IP.
-3. TimerMiddleware runs → starts timing.
-4. Endpoint executes.
-5. TimerMiddleware finishes timing → logs execution duration.
-6. Response is returned to the client.
+2. ObservabilityMiddleware reads method, path, client IP → starts timing.
+3. Endpoint executes; the wrapped `send` records the response status code.
+4. ObservabilityMiddleware finishes timing → logs everything in one line.
+5. Response is returned to the client.
 
 Usage:
 ------
@@ -38,63 +41,88 @@ Usage:
 - Access `http://127.0.0.1:8000/hello`
 - Console will show request logs and processing times.
 
+Logging:
+--------
+Middleware runs on every request, so it must not block the event loop on
+console I/O. Instead of `print()`, it logs through the `http` logger whose
+`QueueHandler` only pushes the record onto an in-memory queue; a background
+`QueueListener` thread does the actual (slow) write to stdout.
+
 """
 
+import asyncio
+import atexit
+import logging
+import queue
+import sys
 import time
-from fastapi import FastAPI, Request
-from starlette.middleware.base import BaseHTTPMiddleware
+from logging.handlers import QueueHandler, QueueListener
+from fastapi import FastAPI
 
 # Initialize FastAPI app
 app = FastAPI()
 
+# Request logger: records are queued on the hot path and written to stdout
+# by a background listener thread.
+log_queue = queue.SimpleQueue()
+logger = logging.getLogger("http")
+logger.setLevel(logging.INFO)
+logger.addHandler(QueueHandler(log_queue))
+logger.propagate = False
 
-class TimerMiddleware(BaseHTTPMiddleware):
-    """
-    Middleware to measure request processing time.
-
-    Inherits:
-        BaseHTTPMiddleware (Starlette) - provides a structure for creating custom middlewares.
-
-    Methods:
-        dispatch(request, call_next):
-            - Records the start time
-            - Processes the request by calling the next handler
-            - Calculates total duration
-            - Logs the result
-            - Returns the response
-    """
-
-    async def dispatch(self, request: Request, call_next):
-        start_time = time.time()
-        response = await call_next(request)
-        duration = time.time() - start_time
-        print(f"⏱ Request: {request.url.path} processed in {duration:.5f} seconds")
-        return response
+log_listener = QueueListener(log_queue, logging.StreamHandler(sys.stdout))
+log_listener.start()
+atexit.register(log_listener.stop)  # flush pending records on shutdown
 
 
-class LoggingMiddleware(BaseHTTPMiddleware):
+class ObservabilityMiddleware:
     """
-    Middleware to log request details.
+    Pure ASGI middleware that logs request details and processing time.
 
     Logs:
         - HTTP method (GET, POST, etc.)
         - Request path (e.g., /hello)
         - Client IP address
+        - Response status code
+        - Total duration in seconds
 
-    Helps in debugging, monitoring, and auditing requests.
+    Non-HTTP scopes (lifespan, websocket) are passed straight through.
     """
 
-    async def dispatch(self, request: Request, call_next):
-        client_host = request.client.host if request.client else "unknown"
-        print(f"📄 Request received: {request.method} {request.url.path} from {client_host}")
-        response = await call_next(request)
-        return response
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        client = scope.get("client")
+        client_host = client[0] if client else "unknown"
+        status_code = 500  # reported if the app fails before starting a response
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        start_time = time.perf_counter()  # monotonic, cheaper than time.time()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            duration = time.perf_counter() - start_time
+            logger.info(
+                "📄 %s %s from %s → %d processed in %.5f seconds",
+                scope["method"], scope["path"], client_host, status_code, duration,
+                extra={
+                    "method": scope["method"], "path": scope["path"], "client": client_host,
+                    "status": status_code, "duration": duration
+                }
+            )
 
 
-# Add custom middlewares to the FastAPI application
-# Order matters: LoggingMiddleware → TimerMiddleware → Route Handler
-app.add_middleware(LoggingMiddleware)
-app.add_middleware(TimerMiddleware)
+# Add the custom middleware to the FastAPI application
+app.add_middleware(ObservabilityMiddleware)
 
 
 @app.get('/hello')
@@ -102,9 +130,10 @@ async def hello():
     """
     Sample endpoint to demonstrate middleware effects.
 
-    This endpoint performs a dummy loop to simulate workload so 
-    that execution time is noticeable when measured by TimerMiddleware.
+    This endpoint sleeps briefly to simulate workload so that execution
+    time is noticeable when measured by ObservabilityMiddleware.
+    `asyncio.sleep` yields to the event loop, so other requests keep being
+    served meanwhile (a busy `for` loop here would block all of them).
     """
-    for _ in range(1000000):
-        pass  # simulate computation workload
+    await asyncio.sleep(0.01)  # simulate I/O workload without blocking the loop
     return {'message': "Hello World!"}
@@ -1,3 +1,7 @@
+# Checked with a single hash probe instead of a scan over a list
+_ELIGIBLE_STATUSES: frozenset[str] = frozenset({'employed', 'self-employed'})
+
+
 def is_eligable_for_load(
         income: float, age: int, employment_status: str
 ) -> bool:
@@ -12,8 +16,9 @@ def is_eligable_for_load(
     Returns:
         bool: True if eligible, False otherwise.
     """
+    # Cheapest check first so invalid ages short-circuit before the rest
     return (
-        (income >= 50000)
-        and (age >= 21)
-        and (employment_status in ['employed', 'self-employed'])
+        (age >= 21)
+        and (income >= 50000)
+        and (employment_status in _ELIGIBLE_STATUSES)
     )
\ No newline at end of file
@@ -68,11 +68,25 @@ class Applicant(BaseModel):
     employment_status: str 
 
 
+class EligibilityResult(BaseModel):
+    """
+    Pydantic model for the eligibility response.
+
+    Attributes:
+        eligible (bool): Whether the applicant is eligible for the loan.
+
+    Purpose:
+        - Declared as the endpoint's return type, so FastAPI serializes it
+          straight to JSON bytes with Pydantic.
+    """
+    eligible: bool
+
+
 # ==========================================================
 # Endpoints
 # ==========================================================
 @app.post('/loan_eligibility')
-def check_eligibility(applicant: Applicant):
+async def check_eligibility(applicant: Applicant) -> EligibilityResult:
     """
     Loan Eligibility Endpoint
     -------------------------
@@ -86,7 +100,7 @@ def check_eligibility(applicant: Applicant):
             - employment_status (str)
 
     Response:
-        JSON object:
+        EligibilityResult JSON object:
             {"eligible": bool}
 
     Logic:
@@ -94,6 +108,11 @@ def check_eligibility(applicant: Applicant):
         2. Call `is_eligable_for_load` from logic.py with applicant details.
         3. Return whether the applicant is eligible as a JSON response.
 
+    Note:
+        Declared `async def` because the work is pure in-memory logic:
+        it runs directly on the event loop instead of being sent to
+        FastAPI's threadpool (as a plain `def` endpoint would be).
+
     Example:
     --------
     Request:
@@ -115,4 +134,4 @@ def check_eligibility(applicant: Applicant):
         employment_status=applicant.employment_status
     )
 
-    return {"eligible": eligibility}
\ No newline at end of file
+    return EligibilityResult(eligible=eligibility)
\ No newline at end of file
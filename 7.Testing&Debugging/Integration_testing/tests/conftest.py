@@ -0,0 +1,26 @@
+"""
+Shared pytest fixtures (conftest.py)
+====================================
+
+Purpose:
+--------
+Provides a single `TestClient` for the whole test session.
+
+Why a session-scoped fixture?
+-----------------------------
+- `with TestClient(app)` runs the app's startup/shutdown (lifespan) events.
+- Scoping it to the session means this happens **once**, not once per test
+  or per parametrized case.
+- Every test simply asks for the `client` argument.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from app.main import app
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Yield one TestClient shared by all tests in the session."""
+    with TestClient(app) as test_client:
+        yield test_client
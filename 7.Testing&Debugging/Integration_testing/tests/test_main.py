@@ -19,7 +19,8 @@ Why Integration Testing?
 Testing Framework:
 ------------------
 - Uses `pytest` style test functions.
-- `TestClient` is provided by FastAPI (built on `requests`) to send test HTTP requests.
+- `TestClient` is provided by FastAPI (built on `httpx`) to send test HTTP requests.
+- The `client` fixture (see `conftest.py`) is created once per test session.
 
 Endpoints Tested:
 -----------------
@@ -38,15 +39,10 @@ Test Cases:
    - Expected: Not eligible → `{'eligible': False}` with HTTP 200.
 """
 
-from fastapi.testclient import TestClient
-from app.main import app
 import pytest
 
-# Create a test client for the FastAPI app
-client = TestClient(app)
 
-
-def test_eligibility_pass():
+def test_eligibility_pass(client):
     """
     Test Case: Loan eligibility - PASS
     ----------------------------------
@@ -74,7 +70,7 @@ def test_eligibility_pass():
     assert response.json() == {'eligible': True}
 
 
-def test_eligibility_fail():
+def test_eligibility_fail(client):
     """
     Test Case: Loan eligibility - FAIL
     ----------------------------------
@@ -112,7 +108,7 @@ def test_eligibility_fail():
     (100000, True),   # High income → Pass
 ])
 
-def test_income_cases(income, expected):
+def test_income_cases(client, income, expected):
     payload = {'income': income, 'age': 30, 'employment_status': 'employed'}
     response = client.post('/loan_eligibility', json=payload)
 
@@ -130,7 +126,7 @@ def test_income_cases(income, expected):
     (25, True),    # Young adult with valid age → Pass
     (60, True),    # Older but still eligible → Pass
 ])
-def test_age_cases(age, expected):
+def test_age_cases(client, age, expected):
     payload = {'income': 70000, 'age': age, 'employment_status': 'employed'}
     response = client.post('/loan_eligibility', json=payload)
 
@@ -148,7 +144,7 @@ def test_age_cases(age, expected):
     ('employed', True),     # Full-time job → Pass
     ('self-employed', True) # Business/self-employed → Pass
 ])
-def test_employment_status_cases(status, expected):
+def test_employment_status_cases(client, status, expected):
     payload = {'income': 80000, 'age': 28, 'employment_status': status}
     response = client.post('/loan_eligibility', json=payload)
 
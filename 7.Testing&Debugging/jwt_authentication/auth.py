@@ -26,7 +26,8 @@ Concepts:
 
 Constants:
 ----------
-- `SECRET_KEY`: A secret string used to sign JWTs (must be kept safe!).
+- `SECRET_KEY`: A secret string used to sign JWTs (must be kept safe!), read from the
+  `JWT_SECRET_KEY` environment variable (a demo key is used when it's not set).
 - `ALGORITHM`: The hashing algorithm used for signing tokens (HS256 in this case).
 - `ACCESS_TOKEN_EXPIRY_MINUTES`: Expiration duration of the access token (default: 30 minutes).
 
@@ -45,8 +46,10 @@ Functions:
 
 """
 
-from datetime import datetime, timedelta, timezone
-from authlib.jose import JoseError, jwt
+import os
+from datetime import datetime, timezone
+
+import jwt  # PyJWT: HMAC signing goes straight to OpenSSL
 from fastapi import HTTPException
 
 
@@ -55,13 +58,16 @@ from fastapi import HTTPException
 # =======================
 
 # Secret key used for signing JWTs (keep this safe and never expose publicly).
-SECRET_KEY = 'my_secrete'
+# HS256 needs a key of at least 32 bytes (RFC 7518), shorter ones make PyJWT warn on
+# every encode/decode; set JWT_SECRET_KEY outside of this demo.
+SECRET_KEY = os.getenv('JWT_SECRET_KEY', 'my_secrete_demo_key_change_me_in_production')
 
 # Algorithm used to sign JWTs (HMAC SHA-256).
 ALGORITHM = 'HS256'
 
 # Duration (in minutes) for which the access token is valid.
 ACCESS_TOKEN_EXPIRY_MINUTES = 30
+ACCESS_TOKEN_EXPIRY_SECONDS = ACCESS_TOKEN_EXPIRY_MINUTES * 60
 
 
 # =======================
@@ -79,19 +85,18 @@ def create_access_tokens(data: dict) -> str:
         str: Encoded JWT token as a string.
 
     Logic:
-        - Define JWT header with chosen algorithm.
-        - Calculate expiration timestamp (current UTC time + expiry minutes).
+        - Calculate expiration as an integer epoch (current UTC time + expiry seconds),
+          so PyJWT doesn't have to convert a datetime on every call.
         - Add `exp` claim (expiration) to payload.
         - Encode the token using SECRET_KEY and return as a string.
     """
-    header = {'alg': ALGORITHM}
-    expire = datetime.now(timezone.utc) + timedelta(minutes=ACCESS_TOKEN_EXPIRY_MINUTES)
+    expire = int(datetime.now(timezone.utc).timestamp()) + ACCESS_TOKEN_EXPIRY_SECONDS
 
     payload = data.copy()  # copy input data so original isn't mutated
     payload.update({'exp': expire})  # add expiration claim
 
-    # Encode header, payload, and secret key into a signed JWT
-    return jwt.encode(header, payload, SECRET_KEY).decode('utf-8')
+    # Sign the payload with SECRET_KEY (PyJWT builds the header from `algorithm`)
+    return jwt.encode(payload, SECRET_KEY, algorithm=ALGORITHM)
 
 
 def verify_token(token: str) -> str:
@@ -108,17 +113,14 @@ def verify_token(token: str) -> str:
         HTTPException 401: If the token is invalid, expired, or missing claims.
 
     Logic:
-        - Decode the token using the SECRET_KEY.
-        - Validate claims (expiration, etc.).
+        - Decode the token using the SECRET_KEY, accepting only ALGORITHM.
+        - PyJWT validates the signature and `exp` claim while decoding.
         - Extract the `sub` claim (username).
         - If missing or invalid → raise Unauthorized (401).
     """
     try:
-        # Decode token with the secret key
-        claims = jwt.decode(token, SECRET_KEY)
-
-        # Validate built-in claims (e.g., expiration)
-        claims.validate()
+        # Decode token with the secret key (also validates expiration)
+        claims = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
 
         # Extract username (subject)
         username = claims.get('sub')
@@ -127,6 +129,6 @@ def verify_token(token: str) -> str:
 
         return username
 
-    except JoseError:
+    except jwt.PyJWTError:
         # Raised when token signature is invalid or expired
         raise HTTPException(status_code=401, detail="Couldn't validate Credentials")
\ No newline at end of file
@@ -26,6 +26,7 @@ Constants:
 """
 
 from fastapi import FastAPI, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 
 # Import custom authentication utilities
@@ -47,7 +48,7 @@ oath2_scheme = OAuth2PasswordBearer(tokenUrl='token')
 # ==========================================================
 
 @app.post('/token')
-def login(form_data: OAuth2PasswordRequestForm = Depends()):
+async def login(form_data: OAuth2PasswordRequestForm = Depends()):
     """
     Login endpoint (POST /token)
     ----------------------------
@@ -67,6 +68,8 @@ def login(form_data: OAuth2PasswordRequestForm = Depends()):
         1. Retrieve user from the mock database (`get_user`).
         2. If user not found → raise HTTP 400 (Invalid Username).
         3. Verify password against stored hash (`verify_password`).
+           - bcrypt is CPU-bound, so it runs in the threadpool and the event loop
+             keeps serving other requests (concurrent logins overlap).
            - If mismatch → raise HTTP 400 (Invalid Password).
         4. If valid → create JWT (`create_access_tokens`) with username as subject (`sub`).
         5. Return token and token type.
@@ -75,7 +78,7 @@ def login(form_data: OAuth2PasswordRequestForm = Depends()):
     if not user_dict:
         raise HTTPException(status_code=400, detail="Invalid User Name")
 
-    if not verify_password(form_data.password, user_dict['hashed_password']):
+    if not await run_in_threadpool(verify_password, form_data.password, user_dict['hashed_password']):
         raise HTTPException(status_code=400, detail="Invalid Password")
 
     access_token = create_access_tokens(data={'sub': form_data.username})
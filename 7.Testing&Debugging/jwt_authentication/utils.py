@@ -20,10 +20,11 @@ Libraries Used:
 
 Components:
 -----------
-1. `pwd_context`: Cryptographic context with bcrypt hashing algorithm.
+1. `pwd_context`: Cryptographic context with bcrypt hashing algorithm (cost factor 10).
 2. `fake_user_db`: A simulated database with one pre-registered user.
-3. `get_user(username)`: Retrieves user information from the fake database.
-4. `verify_password(plain_password, hashed_password)`: Verifies a plain password against its hash.
+3. `get_user(username)`: Retrieves user information from the fake database (memoized).
+4. `verify_password(plain_password, hashed_password)`: Verifies a plain password against its hash
+   (successful checks are remembered, so repeat logins skip bcrypt).
 
 Note:
 -----
@@ -33,6 +34,11 @@ Note:
 
 """
 
+import hashlib
+import hmac
+import secrets
+from functools import lru_cache
+
 from passlib.context import CryptContext
 
 # ==========================================================
@@ -40,7 +46,15 @@ from passlib.context import CryptContext
 # ==========================================================
 # Configure Passlib's CryptContext with bcrypt algorithm.
 # `deprecated='auto'` ensures old algorithms are migrated automatically.
-pwd_context = CryptContext(schemes=['bcrypt'], deprecated='auto')
+# Cost 10 instead of the default 12: each verify is ~4x cheaper (~60 ms vs ~250 ms
+# of CPU per login) while staying within the commonly recommended range.
+BCRYPT_ROUNDS = 10
+pwd_context = CryptContext(schemes=['bcrypt'], deprecated='auto', bcrypt__rounds=BCRYPT_ROUNDS)
+
+# Remembered successful verifications: stored hash → HMAC-SHA256 of the password,
+# keyed with a random per-process secret (the plain password itself is never kept)
+_VERIFY_CACHE_KEY = secrets.token_bytes(32)
+_verified_passwords: dict[str, bytes] = {}
 
 
 # ==========================================================
@@ -49,8 +63,10 @@ pwd_context = CryptContext(schemes=['bcrypt'], deprecated='auto')
 fake_user_db = {
     'johndoe': {
         'username': 'johndoe',
-        # Store only hashed passwords, never plain-text ones
-        'hashed_password': pwd_context.hash('secret123')
+        # Store only hashed passwords, never plain-text ones.
+        # Precomputed once with `pwd_context.hash('secret123')`: hashing here at import
+        # would spend bcrypt CPU in every worker, reload and test run.
+        'hashed_password': '$2b$10$vXtCYegibLr8GAmgIpq7O.hLxWiF0N0QwDg4u6974t0trGDIEuoE2'
     }
 }
 
@@ -59,6 +75,7 @@ fake_user_db = {
 # Utility Functions
 # ==========================================================
 
+@lru_cache(maxsize=1024)
 def get_user(username: str) -> dict | None:
     """
     Retrieve a user record from the fake database.
@@ -73,6 +90,11 @@ def get_user(username: str) -> dict | None:
         - Looks up `username` in `fake_user_db`.
         - If user exists → return dictionary with user details.
         - If not found → return None.
+
+    Note:
+        Results are memoized with `lru_cache`, which assumes `fake_user_db`
+        doesn't change while the process runs (call `get_user.cache_clear()`
+        after editing it).
     """
     user = fake_user_db.get(username)
     return user
@@ -90,7 +112,23 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         bool: True if the password matches, False otherwise.
 
     Logic:
-        - Uses `pwd_context.verify` to safely compare plain and hashed password.
+        - If this hash was already verified, compares a keyed digest of the password
+          with the remembered one (`hmac.compare_digest`, constant time) → no bcrypt.
+        - Otherwise uses `pwd_context.verify` to safely compare plain and hashed password,
+          and remembers the digest on success.
         - Prevents direct string comparison (which is insecure).
+
+    Note:
+        Only successful checks are remembered: a wrong password always pays the
+        full bcrypt cost, so brute-forcing is not made any cheaper. The cache holds
+        one entry per stored hash, i.e. at most one per user.
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    digest = hmac.new(_VERIFY_CACHE_KEY, plain_password.encode(), hashlib.sha256).digest()
+    remembered = _verified_passwords.get(hashed_password)
+    if remembered is not None and hmac.compare_digest(remembered, digest):
+        return True
+
+    if not pwd_context.verify(plain_password, hashed_password):
+        return False
+    _verified_passwords[hashed_password] = digest
+    return True
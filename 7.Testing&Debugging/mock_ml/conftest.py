@@ -0,0 +1,22 @@
+from unittest.mock import patch
+import pytest
+from fastapi.testclient import TestClient
+from mock_ml.main import app, predict_species
+
+
+# One client (and one app startup/shutdown) for the whole test session
+@pytest.fixture(scope="session")
+def client():
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+# patch where it's USED (mock_ml.main.log_model), with a plain MagicMock
+# (autospec=False skips introspecting the real predict signature),
+# and start from an empty prediction cache so the mock is actually called
+@pytest.fixture
+def mock_predict():
+    predict_species.cache_clear()
+    with patch('mock_ml.main.log_model.predict', autospec=False) as mocked:
+        yield mocked
+    predict_species.cache_clear()
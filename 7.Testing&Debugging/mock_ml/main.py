@@ -1,29 +1,94 @@
-from fastapi import FastAPI
-from pydantic import BaseModel
+import threading
+from functools import lru_cache
+from typing import List
+from fastapi import FastAPI, Depends, HTTPException, Request
 from mock_ml.model import log_model
+import msgspec
 import numpy as np
 
 
 app = FastAPI()
 
 
-class IrisFlower(BaseModel):
+# msgspec Struct instead of a pydantic model: the raw JSON body is parsed
+# and validated in a single pass, without an intermediate dict.
+class IrisFlower(msgspec.Struct):
     SepalLengthCm: float
     SepalWidthCm: float
     PetalLengthCm: float
     PetalWidthCm: float
 
 
+def msgspec_body(body_type):
+    # Dependency that decodes the request body into `body_type` with msgspec
+    decoder = msgspec.json.Decoder(body_type)
+
+    async def decode(request: Request):
+        try:
+            return decoder.decode(await request.body())
+        except msgspec.DecodeError as exc:  # also covers msgspec.ValidationError
+            raise HTTPException(status_code=422, detail=str(exc))
+
+    return decode
+
+
+def openapi_body(schema: dict) -> dict:
+    # FastAPI can't see msgspec bodies, so document them explicitly
+    return {'requestBody': {'required': True, 'content': {'application/json': {'schema': schema}}}}
+
+
+_iris_schema = msgspec.json.schema_components([IrisFlower])[1]['IrisFlower']
+
+
+# Sync endpoints run in a threadpool, so each thread gets its own
+# preallocated (1, 4) feature buffer that is refilled in place per call.
+_local = threading.local()
+
+
+def feature_buffer() -> np.ndarray:
+    buf = getattr(_local, 'buf', None)
+    if buf is None:
+        buf = _local.buf = np.empty((1, 4), dtype=np.float64)
+    return buf
+
+
+# Identical inputs always give the same class, so repeated requests are
+# answered from an in-process cache instead of calling the model again.
+@lru_cache(maxsize=4096)
+def predict_species(sepal_length: float, sepal_width: float,
+                    petal_length: float, petal_width: float) -> int:
+    features = feature_buffer()
+    features[0, 0] = sepal_length
+    features[0, 1] = sepal_width
+    features[0, 2] = petal_length
+    features[0, 3] = petal_width
+    prediction = log_model.predict(features)
+    return int(prediction[0])
+
+
 # Endpoints
-@app.post('/predict')
-def predict(data: IrisFlower):
-    features = np.array([
+@app.post('/predict', openapi_extra=openapi_body(_iris_schema))
+def predict(data: IrisFlower = Depends(msgspec_body(IrisFlower))):
+    prediction = predict_species(
+        data.SepalLengthCm,
+        data.SepalWidthCm,
+        data.PetalLengthCm,
+        data.PetalWidthCm
+    )
+    return {'prediction':prediction}
+
+
+# Many samples in one request: a single array build and one model call
+@app.post('/predict_batch', openapi_extra=openapi_body({'type': 'array', 'items': _iris_schema}))
+def predict_batch(data: List[IrisFlower] = Depends(msgspec_body(List[IrisFlower]))):
+    features = np.asarray([
         [
-            data.SepalLengthCm,
-            data.SepalWidthCm,
-            data.PetalLengthCm,
-            data.PetalWidthCm
+            d.SepalLengthCm,
+            d.SepalWidthCm,
+            d.PetalLengthCm,
+            d.PetalWidthCm
         ]
-    ])
-    prediction = log_model.predict(features)
-    return {'prediction':int(prediction[0])}
\ No newline at end of file
+        for d in data
+    ], dtype=np.float64).reshape(-1, 4)
+    predictions = log_model.predict(features) if len(data) else []
+    return {'predictions': [int(p) for p in predictions]}
@@ -4,4 +4,7 @@ import os
 # Build the correct path to the joblib file inside mock_ml
 model_path = os.path.join(os.path.dirname(__file__), "log_model.joblib")
 
-log_model = joblib.load(model_path)
+# mmap_mode="r": NumPy arrays inside the model are memory-mapped from the file
+# instead of copied into each process, so forked workers (e.g. gunicorn --preload)
+# share the same pages. Only works because log_model.joblib is saved uncompressed.
+log_model = joblib.load(model_path, mmap_mode="r")
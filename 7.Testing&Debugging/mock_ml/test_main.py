@@ -1,30 +1,69 @@
-from unittest.mock import patch
 import numpy as np
-from mock_ml.main import app
-from fastapi.testclient import TestClient
-
-client = TestClient(app)
-
-def test_predict_with_mock():
-    # patch where it's USED (mock_ml.main.log_model)
-    with patch('mock_ml.main.log_model.predict') as mock_predict:
-        mock_predict.return_value = [99]
-
-        response = client.post(
-            "/predict",
-            json={
-                "SepalLengthCm": 5.2,
-                "SepalWidthCm": 3.5,
-                "PetalLengthCm": 1.5,
-                "PetalWidthCm": 0.2
-            }
-        )
-
-        assert response.status_code == 200
-        assert response.json() == {'prediction': 99}
-
-        # Extract the arguments passed to mock_predict
-        args, kwargs = mock_predict.call_args
-
-        expected = np.array([[5.2, 3.5, 1.5, 0.2]])
-        np.testing.assert_array_equal(args[0], expected)
\ No newline at end of file
+
+
+def test_predict_with_mock(client, mock_predict):
+    mock_predict.return_value = [99]
+
+    response = client.post(
+        "/predict",
+        json={
+            "SepalLengthCm": 5.2,
+            "SepalWidthCm": 3.5,
+            "PetalLengthCm": 1.5,
+            "PetalWidthCm": 0.2
+        }
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {'prediction': 99}
+
+    # Extract the arguments passed to mock_predict
+    args, kwargs = mock_predict.call_args
+
+    expected = np.array([[5.2, 3.5, 1.5, 0.2]])
+    np.testing.assert_array_equal(args[0], expected)
+
+
+def test_predict_repeated_input_is_cached(client, mock_predict):
+    mock_predict.return_value = [1]
+    payload = {
+        "SepalLengthCm": 6.1,
+        "SepalWidthCm": 2.8,
+        "PetalLengthCm": 4.7,
+        "PetalWidthCm": 1.2
+    }
+
+    first = client.post("/predict", json=payload)
+    second = client.post("/predict", json=payload)
+
+    assert first.json() == second.json() == {'prediction': 1}
+    # the second request is served from the cache
+    assert mock_predict.call_count == 1
+
+
+def test_predict_batch_with_mock(client, mock_predict):
+    mock_predict.return_value = np.array([0, 2])
+
+    response = client.post(
+        "/predict_batch",
+        json=[
+            {"SepalLengthCm": 5.2, "SepalWidthCm": 3.5, "PetalLengthCm": 1.5, "PetalWidthCm": 0.2},
+            {"SepalLengthCm": 6.7, "SepalWidthCm": 3.0, "PetalLengthCm": 5.2, "PetalWidthCm": 2.3}
+        ]
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {'predictions': [0, 2]}
+
+    # one model call for the whole batch
+    args, kwargs = mock_predict.call_args
+    expected = np.array([[5.2, 3.5, 1.5, 0.2], [6.7, 3.0, 5.2, 2.3]])
+    np.testing.assert_array_equal(args[0], expected)
+    assert mock_predict.call_count == 1
+
+
+def test_predict_invalid_payload(client):
+    response = client.post("/predict", json={"SepalLengthCm": "long"})
+
+    # rejected by the msgspec decoder before reaching the model
+    assert response.status_code == 422
@@ -0,0 +1,141 @@
+"""
+run.py
+
+Production launcher shared by the FastAPI apps in this repository.
+
+Starts uvicorn with the fast event loop (uvloop) and HTTP parser (httptools)
+instead of the default asyncio + h11, one worker process per CPU core, and
+access logs disabled (a per-request stdout write).
+
+Usage:
+    python run.py APP [--app-dir DIR]
+
+    APP is the "module:attribute" import string of the application, and DIR is
+    the directory it is imported from (default: the current directory):
+
+    cd 4.Database_Integration
+    python ../run.py crud_app.main:app               → Employee CRUD API
+
+    python run.py BuildingAPIs.main:app --app-dir <folder containing BuildingAPIs/>
+                                                     → in-memory Employee API
+
+    cd 5.Machine_Learning_Integration/ml_model       (next to `model.joblib`)
+    python ../../run.py ml_model.main:app --app-dir ..   → ML prediction API
+
+Environment Variables:
+    - HOST               (default: 0.0.0.0)
+    - PORT               (default: 8000)
+    - WEB_CONCURRENCY    Number of worker processes (default: CPU count). The async
+                         endpoints don't block, so one worker per core keeps every core
+                         busy; the "2 x cores + 1" rule is meant for blocking workers.
+    - LIMIT_CONCURRENCY  Max concurrent connections before 503 (default: 1000)
+    - BACKLOG            Max pending connections in the socket queue (default: 2048)
+    - REUSE_PORT         1 → one SO_REUSEPORT socket per worker process (default: 0)
+    - OMP_NUM_THREADS / OPENBLAS_NUM_THREADS / MKL_NUM_THREADS
+                         Threads of NumPy's BLAS pool per worker (default: 1). Parallelism
+                         comes from the worker processes, so one BLAS thread each avoids
+                         N workers x N cores threads oversubscribing the CPU.
+
+Notes:
+    - Every worker is a separate process: in-memory state (e.g. BuildingAPIs'
+      `employees_db`) is per worker, each worker has its own database connection
+      pool (keep (DB_POOL_SIZE + DB_MAX_OVERFLOW) x WEB_CONCURRENCY below the
+      database's max_connections), and each worker loads and warms up its own
+      copy of the ML model in the app's `lifespan` handler.
+    - With `REUSE_PORT=1` (Linux/BSD), each worker binds its own listening socket
+      with SO_REUSEPORT instead of all workers accepting from the one socket
+      inherited from the parent, and the kernel spreads new connections across
+      them. There is no supervisor in this mode: a crashed worker is not
+      restarted (use gunicorn's `--reuse-port` below if you need that).
+
+Equivalent CLI:
+    uvicorn crud_app.main:app --loop uvloop --http httptools --workers $(nproc) \\
+        --no-access-log --limit-concurrency 1000 --backlog 2048
+    gunicorn ml_model.main:app -k uvicorn.workers.UvicornWorker -w $(nproc) \\
+        --pythonpath .. --bind 0.0.0.0:8000 [--reuse-port]
+"""
+
+import argparse
+import multiprocessing
+import os
+import signal
+import socket
+import sys
+
+import uvicorn
+
+# uvloop is not available on Windows, fall back to the default asyncio loop there
+LOOP = "asyncio" if sys.platform == "win32" else "uvloop"
+
+# One BLAS thread per worker (inherited by the worker processes, read when NumPy loads)
+for var in ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS"):
+    os.environ.setdefault(var, "1")
+
+HOST = os.getenv("HOST", "0.0.0.0")
+PORT = int(os.getenv("PORT", "8000"))
+WORKERS = int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1))
+BACKLOG = int(os.getenv("BACKLOG", "2048"))
+REUSE_PORT = os.getenv("REUSE_PORT", "0") == "1" and hasattr(socket, "SO_REUSEPORT")
+
+SERVER_OPTIONS = dict(
+    loop=LOOP,
+    http="httptools",
+    access_log=False,
+    limit_concurrency=int(os.getenv("LIMIT_CONCURRENCY", "1000")),
+    backlog=BACKLOG,
+)
+
+
+def serve_reuse_port(app: str, app_dir: str) -> None:
+    """
+    Run one uvicorn server (in the current process) on its own SO_REUSEPORT socket.
+    """
+    sys.path.insert(0, app_dir)
+
+    family = socket.AF_INET6 if ":" in HOST else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    sock.bind((HOST, PORT))
+
+    config = uvicorn.Config(app, host=HOST, port=PORT, **SERVER_OPTIONS)
+    uvicorn.Server(config).run(sockets=[sock])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run a FastAPI app with uvloop/httptools workers.")
+    parser.add_argument("app", help='import string of the application, e.g. "crud_app.main:app"')
+    parser.add_argument("--app-dir", default=".", help="directory the app is imported from")
+    args = parser.parse_args()
+    app_dir = os.path.abspath(args.app_dir)
+
+    if REUSE_PORT:
+        # Same start method uvicorn uses for its own workers
+        ctx = multiprocessing.get_context("spawn")
+        workers = [
+            ctx.Process(target=serve_reuse_port, args=(args.app, app_dir)) for _ in range(WORKERS)
+        ]
+        for worker in workers:
+            worker.start()
+        # Pass a stop request (e.g. `docker stop`) on to the workers for a graceful shutdown
+        signal.signal(signal.SIGTERM, lambda *_: [worker.terminate() for worker in workers])
+        try:
+            for worker in workers:
+                worker.join()
+        except KeyboardInterrupt:
+            # Ctrl+C reaches every worker, which shuts down gracefully on its own
+            for worker in workers:
+                worker.join()
+    else:
+        uvicorn.run(
+            args.app,
+            app_dir=app_dir,
+            host=HOST,
+            port=PORT,
+            workers=WORKERS,
+            **SERVER_OPTIONS,
+        )
+
+
+if __name__ == "__main__":
+    main()